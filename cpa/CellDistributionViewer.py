@@ -174,7 +174,7 @@ if __name__ == "__main__":
               ]
     clrs = [[225, 200, 160], [219, 112, 147], [219, 112, 147], [219, 112, 147], [219, 112, 147]]
 
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     frame = wx.Frame(None, -1, " Demo with Notebook")
     nb = wx.Notebook(frame, -1)
     simplepanel = wx.Panel(nb, style=wx.BORDER)
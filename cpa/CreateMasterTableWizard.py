@@ -435,7 +435,7 @@ class Page4(wiz.WizardPageSimple):
             
 
 
-app = wx.PySimpleApp()
+app = wx.App(False)
 wizard = wiz.Wizard(None, -1, "Create Master Table", style=wx.DEFAULT_DIALOG_STYLE|wx.RESIZE_BORDER)
 page1 = Page1(wizard)
 page2 = Page2(wizard)
@@ -383,7 +383,7 @@ class BoxPlot(wx.Frame, CPATool):
 
                     
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(level=logging.DEBUG,)
 
     if len(sys.argv) > 1:
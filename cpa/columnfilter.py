@@ -265,7 +265,7 @@ if __name__ == "__main__":
     import sys
     import logging
     logging.basicConfig(level=logging.DEBUG)
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     
     # Load a properties file if passed in args
     if len(sys.argv) > 1:
@@ -76,11 +76,19 @@ class DataModel(Singleton):
     def DeleteModel(self):
         self.data = {}
         self.groupMaps = {}
+        self.revGroupMaps = {}
+        self.groupColNames = {}
+        self.groupColTypes = {}
         self.cumSums = []
         self.obCount = 0
+        self.keylist = []
+        # Cached lookups derived from the database must be rebuilt too
+        self.filterkeys = {}
+        self.plate_map = {}
+        self.rev_plate_map = {}
         
     def _if_empty_populate(self):
-        if self.IsEmpty:
+        if self.IsEmpty():
             self.PopulateModel()
             
     def get_total_object_count(self):
@@ -120,8 +128,7 @@ class DataModel(Singleton):
         if N > self.obCount:
             logging.info(str(N) +' is greater than the number of objects. Fetching ' + str(self.obCount) + ' objects.')
             N = self.obCount
-            print(self.obCount)
-        if imKeys == None:
+        if imKeys is None:
             return self.GetRandomObject(N)
         elif imKeys == []:
             return []
@@ -239,16 +246,17 @@ class DataModel(Singleton):
             
         # apply filter if supplied
         if filter_name is not None:
-            if filter_name not in self.filterkeys.keys():
-                self.filterkeys[filter_name] = db.GetFilteredImages(filter_name)
-            imkeys = set(imkeys).intersection(self.filterkeys[filter_name])    
+            if filter_name not in self.filterkeys:
+                self.filterkeys[filter_name] = set(db.GetFilteredImages(filter_name))
+            imkeys = self.filterkeys[filter_name].intersection(imkeys)
         
         return imkeys
     
     def GetGroupKeysInGroup(self, group):
         ''' Returns all groupKeys in specified group '''
         self._if_empty_populate()
-        return list(set(self.groupMaps[group].values()))
+        # the reverse map is keyed by the distinct group keys already
+        return list(self.revGroupMaps[group].keys())
         
     def IsEmpty(self):
         return self.data == {}
@@ -267,6 +275,14 @@ class DataModel(Singleton):
             raise ValueError('Unknown well format: %s' % repr(p.well_format))
         
         pshape = p.plate_shape
+        # Built once per plate format rather than once per well
+        well_pattern = re.compile(well_re)
+        if pshape[0] <= 26:
+            lower = 'abcdefghijklmnopqrstuvwxyz'
+            row_index = dict(zip(lower, range(26)))
+            row_index.update(zip(lower.upper(), range(26)))
+        else:
+            row_index = dict((ch, i) for i, ch in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'))
         
         res = db.execute('SELECT DISTINCT %s FROM %s '%(p.well_id, p.image_table))
         for r in res:
@@ -274,7 +290,7 @@ class DataModel(Singleton):
             # Make sure all well entries match the naming format
             if type(well) == str:
                 well = well.strip()
-                assert re.match(well_re, well), 'Well "%s" did not match well naming format "%s"'%(r[0], p.well_format)
+                assert well_pattern.match(well), 'Well "%s" did not match well naming format "%s"'%(r[0], p.well_format)
             elif type(well) in [int, long]:
                 if not p.well_format == '123':
                     '''
@@ -293,19 +309,14 @@ class DataModel(Singleton):
                     return
 
             if p.well_format == 'A01':
-                if pshape[0] <= 26:
-                    row = 'abcdefghijklmnopqrstuvwxyz'.index(well[0].lower())
-                    col = int(well[1:]) - 1
-                elif pshape[0] <= 52:
-                    row = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'.index(well[0])
-                    col = int(well[1:]) - 1
-                else:
+                if pshape[0] > 52:
                     raise ValueError('Plates with over 52 rows cannot have well format "A01" Check your properties file.')
+                row = row_index[well[0]]
+                col = int(well[1:]) - 1
                 self.plate_map[well] = (row, col)
                 self.rev_plate_map[(row, col)] = well
             elif p.well_format == '123':
-                row = (int(well) - 1) / pshape[1]
-                col = (int(well) - 1) % pshape[1]
+                row, col = divmod(int(well) - 1, pshape[1])
                 self.plate_map[well] = (row, col)
                 self.rev_plate_map[(row, col)] = well
     
@@ -319,20 +330,21 @@ class DataModel(Singleton):
             pass
         if self.plate_map == {}:
             self.populate_plate_maps()
-        if well_name in self.plate_map.keys():
+        try:
             return self.plate_map[well_name]
-        else:
+        except KeyError:
             raise KeyError('Well name "%s" could not be mapped to a plate position.' % well_name)
 
-    def get_well_name_from_position(self, (row, col)):
+    def get_well_name_from_position(self, position):
         '''returns the well name (eg: "A01") corresponding to the given 
         plate position tuple.
         '''
+        row, col = position
         if self.plate_map == {}:
             self.populate_plate_maps()
-        if (row, col) in self.rev_plate_map.keys():
+        try:
             return self.rev_plate_map[(row, col)]
-        else:
+        except KeyError:
             raise KeyError('Plate position "%s" could not be mapped to a well key.' % str((row,col)))
 
 
@@ -609,7 +609,7 @@ Parameters:
 
 if __name__ == "__main__":
     import sys
-    app = wx.PySimpleApp()
+    app = wx.App(False)
 
     if len(sys.argv) == 1:
         # ---- testing ----
@@ -189,17 +189,17 @@ def GetWhereClauseForImages(imkeys):
     if not p.table_id:
         return '%s IN (%s)'%(p.image_id, ','.join([str(k[0]) for k in imkeys]))
     else:
+        if len(imkeys) == 0:
+            return ''
         imkeys = np.array(imkeys)
-        count = 0
-        tnum = 0
+        # keys are sorted, so each table's images form a contiguous run
+        # starting at the first occurrence of its table number
+        tnums, starts = np.unique(imkeys[:,0], return_index=True)
+        ends = list(starts[1:]) + [len(imkeys)]
         wheres = []
-        while count < len(imkeys):
-            imnums = imkeys[(imkeys[:,0]==tnum), 1]
-            count += len(imnums)
-            if len(imnums)>0:
-                wheres += ['(%s=%s AND %s IN (%s))'%(p.table_id, tnum, 
-                            p.image_id, ','.join([str(k) for k in imnums]))]
-            tnum += 1
+        for tnum, lo, hi in zip(tnums, starts, ends):
+            wheres.append('(%s=%s AND %s IN (%s))'%(p.table_id, tnum, 
+                          p.image_id, ','.join([str(k) for k in imkeys[lo:hi, 1]])))
         return ' OR '.join(wheres)
 
 def GetWhereClauseForWells(keys, table_name=None):
@@ -313,7 +313,7 @@ class DBConnect(Singleton):
         
         logging.info('[%s] Connecting to the database...'%(connID))
         # If this connection ID already exists print a warning
-        if connID in self.connections.keys():
+        if connID in self.connections:
             if self.connectionInfo[connID] == (p.db_host, p.db_user, 
                                                (p.db_passwd or None), p.db_name):
                 logging.warn('A connection already exists for this thread. %s as %s@%s (connID = "%s").'%(p.db_name, p.db_user, p.db_host, connID))
@@ -472,7 +472,7 @@ class DBConnect(Singleton):
     def CloseConnection(self, connID=None):
         if not connID:
             connID = threading.currentThread().getName()
-        if connID in self.connections.keys():
+        if connID in self.connections:
             try:
                 self.connections[connID].commit()
             except: pass
@@ -496,7 +496,7 @@ class DBConnect(Singleton):
 
         # Grab a new connection if this is a new thread
         connID = threading.currentThread().getName()
-        if not connID in self.connections.keys():
+        if connID not in self.connections:
             self.connect()
 
         try:
@@ -595,7 +595,6 @@ class DBConnect(Singleton):
         records = []
         while True:
             r = self.cursors[connID].fetchmany(n)
-            print(len(r))
             if len(r) == 0:
                 break
             records.extend(list(r))
@@ -755,10 +754,7 @@ class DBConnect(Singleton):
         d = {}
         for row in res:
             if reverse:
-                d[row[key_size:]] = []
-        for row in res:
-            if reverse:
-                d[row[key_size:]] += [row[:key_size]]
+                d.setdefault(row[key_size:], []).append(row[:key_size])
             else:
                 d[row[:key_size]] = row[key_size:]
         return d, col_names
@@ -1120,7 +1116,7 @@ class DBConnect(Singleton):
         Returns a list of measurements for the specified object excluding
         those specified in Properties.classifier_ignore_columns
         '''
-        if (self.classifierColNames == None):
+        if self.classifierColNames is None:
             self.GetColnamesForClassifier()
         if isinstance(obKey, str):
             whereclause = obKey
@@ -1998,7 +1994,7 @@ class Objects(Entity):
 if __name__ == "__main__":
     ''' For debugging only... '''
     import wx
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
     p.LoadFile('/Users/afraser/cpa_example/example.properties')
     
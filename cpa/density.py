@@ -427,7 +427,8 @@ class DensityPanel(FigureCanvasWxAgg):
         if evt.button == 3: # right click
             self.show_popup_menu((evt.x, self.canvas.GetSize()[1]-evt.y), None)
             
-    def show_popup_menu(self, (x,y), data):
+    def show_popup_menu(self, pos, data):
+        x, y = pos
         self.popup_menu_filters = {}
         popup = wx.Menu()
         loadimages_table_item = popup.Append(-1, 'Create gated table for CellProfiler LoadImages')
@@ -436,7 +437,7 @@ class DensityPanel(FigureCanvasWxAgg):
         if selected_gate:
             selected_gates = [selected_gate]
         self.Bind(wx.EVT_MENU, 
-                  lambda(e):ui.prompt_user_to_create_loadimages_table(self, selected_gates), 
+                  lambda e:ui.prompt_user_to_create_loadimages_table(self, selected_gates), 
                   loadimages_table_item)
         
         show_images_in_gate_item = popup.Append(-1, 'Show images in gate')
@@ -522,7 +523,7 @@ class Density(wx.Frame, CPATool):
 
 
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(level=logging.DEBUG,)
     # Load a properties file if passed in args
     if len(sys.argv) > 1:
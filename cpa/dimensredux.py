@@ -635,7 +635,7 @@ class PlotMain(wx.Frame):
         self.figure_loadings.set_plot_type("Loadings")
 
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(level=logging.INFO,)
 
     global p
@@ -49,7 +49,8 @@ class GatingHelper(object):
             self.gate.removeobserver(self.redraw)
         p.gates.removeobserver(self.on_gate_list_changed)
             
-    def on_gate_list_changed(self, (name, gate)):
+    def on_gate_list_changed(self, change):
+        name, gate = change
         if gate is None:
             # a gate was deleted, check to see if it was this gate.
             if self.gate not in p.gates.values():
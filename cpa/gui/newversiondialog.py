@@ -73,7 +73,7 @@ if __name__ == "__main__":
     def sk():
         print("skip this version")
 
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     dialog = NewVersionDialog(None, "New version available", 
                               "<h1>NEW REVISION: TEH AWESOME</h1>awesome new features!<br>get it now!", 
                               "http://cellprofiler.org/", 
@@ -843,7 +843,7 @@ def show_load_dialog():
             
         
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     import logging, sys
     logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
     p.load_file('/Users/afraser/cpa_example/example.properties')
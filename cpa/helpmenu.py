@@ -33,7 +33,7 @@ def make_help_menu(frame):
     return helpMenu
 
 if __name__ == '__main__':
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     frame = wx.Frame(None, title='Test help menu')
     menu_bar = wx.MenuBar()
     menu_bar.Append(make_help_menu(frame), 'Help')
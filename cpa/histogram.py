@@ -316,8 +316,9 @@ class HistogramPanel(FigureCanvasWxAgg):
         if evt.button == 3: # right click
             self.show_popup_menu((evt.x, self.canvas.GetSize()[1]-evt.y), None)
             
-    def show_popup_menu(self, (x,y), data):
+    def show_popup_menu(self, pos, data):
         '''Show context sensitive popup menu.'''
+        x, y = pos
         self.popup_menu_filters = {}
         popup = wx.Menu()
         loadimages_table_item = popup.Append(-1, 'Create gated table for CellProfiler LoadImages')
@@ -326,7 +327,7 @@ class HistogramPanel(FigureCanvasWxAgg):
         if selected_gate:
             selected_gates = [selected_gate]
         self.Bind(wx.EVT_MENU, 
-                  lambda(e):ui.prompt_user_to_create_loadimages_table(self, selected_gates), 
+                  lambda e:ui.prompt_user_to_create_loadimages_table(self, selected_gates), 
                   loadimages_table_item)
         
         show_images_in_gate_item = popup.Append(-1, 'Show images in gate')
@@ -420,7 +421,7 @@ class Histogram(wx.Frame, CPATool):
         
         
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(level=logging.DEBUG,)
 
     # Load a properties file if passed in args
@@ -69,7 +69,7 @@ class ImageListFrame(wx.Frame):
         
         
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(level=logging.DEBUG,)
     
     if not p.show_load_dialog():
@@ -123,7 +123,7 @@ if __name__ == "__main__":
     from imageviewer import ImageViewer
     import sys
 
-    app = wx.PySimpleApp()
+    app = wx.App(False)
 
     p = Properties.getInstance()
     dm = DataModel.getInstance()
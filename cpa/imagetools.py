@@ -74,11 +74,13 @@ def ShowImage(imKey, chMap, parent=None, brightness=1.0, scale=1.0, contrast=Non
     frame.Show(True)
     return frame
 
-def Crop(imgdata, (w,h), (x,y)):
+def Crop(imgdata, size, pos):
     '''
     Crops an image to the width (w,h) around the point (x,y).
     Area outside of the image is filled with the color specified.
     '''
+    w, h = size
+    x, y = pos
     im_width = imgdata.shape[1]
     im_height = imgdata.shape[0]
 
@@ -672,7 +672,7 @@ class NormalizationUI(wx.Frame, CPATool):
 
             
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(level=logging.DEBUG)
     
     if p.show_load_dialog():
@@ -217,7 +217,7 @@ def create_per_object_table(well_result_files):
                    float(tr.getAttribute('y'))]
             row += [float(col.firstChild.data) 
                     for col in tr.childNodes if col.firstChild]
-            rows += [row]
+            rows.append(row)
             object_number += 1
         
         # Insert rows from this well result file
@@ -468,7 +468,7 @@ def get_object_results_files_columbus(doc):
     for ref in doc.getElementsByTagName('Reference'):
         if ref.getAttribute('Class') == 'WELLRESULT':
             assert ref.firstChild.nodeType == ref.TEXT_NODE
-            well_result_files += [ref.firstChild.data]
+            well_result_files.append(ref.firstChild.data)
     return well_result_files
 
 def get_object_results_files_harmony(results_dir):
@@ -554,7 +554,7 @@ def get_resultgroup_param_ids_from_plate_results(plate_results_file):
 #
 
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
 ##    load_columbus('/Users/afraser/Desktop/PKI Example Data/Columbus/P010-R ETAR[56]_SinglePlaneTIF/MeasurementIndex.ColumbusIDX.xml')
 ##    load_harmony('/Users/afraser/Desktop/PKI Example Data/Harmony/P010-R ETAR__2009-02-12T17_11_35-Measurement1/Evaluation1/PlateResults.xml')
     load_harmony('/Users/afraser/Desktop/PKI Example Data/Harmony/P018-Colony Formation__2010-09-17T11_57_24-Measurement1/Evaluation1/PlateResults.xml')
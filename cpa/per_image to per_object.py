@@ -157,7 +157,7 @@ def run():
     sys.exit()
 
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     run()
     app.MainLoop()
 
@@ -398,7 +398,7 @@ class PlateMapPanel(wx.Panel):
         '''handler -- a function to call on well selection. The handler must
               take a single well_key parameter.
         '''
-        self.well_selection_handlers += [handler]
+        self.well_selection_handlers.append(handler)
             
     def GetX(self, evt):
         if wx.VERSION[0] >= 2 and wx.VERSION[1] > 8:
@@ -485,14 +485,14 @@ class PlateMapPanel(wx.Panel):
             except IOError as e:
                 pngs = [Image.open(StringIO(b64decode(im)), 'r') for im in channels]
 
-            imsets += [[np.fromstring(png.tobytes(), dtype='uint8').reshape(png.size[1], png.size[0]).astype('float32') / 255
-                        for png in pngs]]                
+            imsets.append([np.fromstring(png.tobytes(), dtype='uint8').reshape(png.size[1], png.size[0]).astype('float32') / 255
+                           for png in pngs])
         
         n_channels = len(imsets[0])
         composite = []
         for i in xrange(n_channels):
             # composite each channel separately
-            composite += [imagetools.tile_images([imset[i] for imset in imsets])]
+            composite.append(imagetools.tile_images([imset[i] for imset in imsets]))
         bmp = imagetools.MergeToBitmap(composite, p.image_channel_colors)
         
         popup = BitmapPopup(self, bmp, pos=pos)
@@ -500,7 +500,7 @@ class PlateMapPanel(wx.Panel):
 
         
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
 
     data = np.arange(5600.)
     a = np.zeros((40,140))
@@ -191,7 +191,7 @@ class PlateViewer(wx.Frame, CPATool):
                          (dbconnect.UniqueWellClause(), p.image_table, p.well_id, p.well_id))
 
         if p.plate_id:
-            self.plateMapChoices += [ComboBox(self, choices=db.GetPlateNames(), size=(400,-1))]
+            self.plateMapChoices.append(ComboBox(self, choices=db.GetPlateNames(), size=(400,-1)))
             self.plateMapChoices[-1].Select(plateIndex)
             self.plateMapChoices[-1].Bind(wx.EVT_COMBOBOX, self.OnSelectPlate)
     
@@ -207,7 +207,7 @@ class PlateViewer(wx.Frame, CPATool):
                                      colormap = self.colorMapsChoice.Value,
                                      well_disp = self.wellDisplayChoice.Value)
         platemap.add_well_selection_handler(self.OnSelectWell)
-        self.plateMaps += [platemap]
+        self.plateMaps.append(platemap)
 
         singlePlateMapSizer = wx.BoxSizer(wx.VERTICAL)
         if p.plate_id:
@@ -230,26 +230,26 @@ class PlateViewer(wx.Frame, CPATool):
         select = list(well_key_cols)
         if not categorical:
             if self.aggMethod=='mean':
-                select += [sql.Column(table, measurement, 'AVG')]
+                select.append(sql.Column(table, measurement, 'AVG'))
             elif self.aggMethod=='stdev':
-                select += [sql.Column(table, measurement, 'STDDEV')]
+                select.append(sql.Column(table, measurement, 'STDDEV'))
             elif self.aggMethod=='cv%':
                 # stddev(col) / avg(col) * 100
-                select += [sql.Expression(
+                select.append(sql.Expression(
                               sql.Column(table, measurement, 'STDDEV'), ' / ',
-                              sql.Column(table, measurement, 'AVG'), ' * 100')]
+                              sql.Column(table, measurement, 'AVG'), ' * 100'))
             elif self.aggMethod=='sum':
-                select += [sql.Column(table, measurement, 'SUM')]
+                select.append(sql.Column(table, measurement, 'SUM'))
             elif self.aggMethod=='min':
-                select += [sql.Column(table, measurement, 'MIN')]
+                select.append(sql.Column(table, measurement, 'MIN'))
             elif self.aggMethod=='max':
-                select += [sql.Column(table, measurement, 'MAX')]
+                select.append(sql.Column(table, measurement, 'MAX'))
             elif self.aggMethod=='median':
-                select += [sql.Column(table, measurement, 'MEDIAN')]
+                select.append(sql.Column(table, measurement, 'MEDIAN'))
             elif self.aggMethod=='none':
-                select += [sql.Column(table, measurement)]
+                select.append(sql.Column(table, measurement))
         else:
-            select += [sql.Column(table, measurement)]
+            select.append(sql.Column(table, measurement))
         
         q.set_select_clause(select)
         q.set_group_columns(well_key_cols)
@@ -268,36 +268,47 @@ class PlateViewer(wx.Frame, CPATool):
             if row[-1] is None:
                 row[-1] = np.nan
 
+        if not categorical:
+            # Convert the measurement column once and reuse it for both the
+            # local and global extents below
+            values = [float(row[-1]) for row in wellkeys_and_values]
+
         data = []
         key_lists = []
         dmax = -np.inf
         dmin = np.inf
         if p.plate_id:
+            # Index rows by plate in one pass rather than rescanning every
+            # row for each plate map
+            rows_by_plate = {}
+            for row in wellkeys_and_values:
+                rows_by_plate.setdefault(str(row[0]), []).append(row)
             for plateChoice, plateMap in zip(self.plateMapChoices, self.plateMaps):
                 plate = plateChoice.Value
                 plateMap.SetPlate(plate)
                 self.colorBar.AddNotifyWindow(plateMap)
-                self.keys_and_vals = [v for v in wellkeys_and_values if str(v[0])==plate]
+                self.keys_and_vals = rows_by_plate.get(plate, [])
                 platedata, wellkeys, ignore = FormatPlateMapData(self.keys_and_vals, categorical)
-                data += [platedata]
-                key_lists += [wellkeys]
+                data.append(platedata)
+                key_lists.append(wellkeys)
                 if not categorical:
-                    dmin = np.nanmin([float(kv[-1]) for kv in self.keys_and_vals]+[dmin])
-                    dmax = np.nanmax([float(kv[-1]) for kv in self.keys_and_vals]+[dmax])
+                    plate_values = [float(kv[-1]) for kv in self.keys_and_vals]
+                    dmin = np.nanmin(plate_values+[dmin])
+                    dmax = np.nanmax(plate_values+[dmax])
         else:
             self.colorBar.AddNotifyWindow(self.plateMaps[0])
             platedata, wellkeys, ignore = FormatPlateMapData(wellkeys_and_values, categorical)
-            data += [platedata]
-            key_lists += [wellkeys]
+            data.append(platedata)
+            key_lists.append(wellkeys)
             if not categorical:
-                dmin = np.nanmin([float(kv[-1]) for kv in wellkeys_and_values])
-                dmax = np.nanmax([float(kv[-1]) for kv in wellkeys_and_values])
+                dmin = np.nanmin(values)
+                dmax = np.nanmax(values)
             
         if not categorical:
             if len(wellkeys_and_values) > 0:
                 # Compute the global extents if there is any data whatsoever
-                gmin = np.nanmin([float(vals[-1]) for vals in wellkeys_and_values])
-                gmax = np.nanmax([float(vals[-1]) for vals in wellkeys_and_values])
+                gmin = np.nanmin(values)
+                gmax = np.nanmax(values)
                 if np.isinf(dmin) or np.isinf(dmax):
                     gmin = gmax = dmin = dmax = 1.
                     # Warn if there was no data for this plate (and no filter was used)
@@ -484,7 +495,7 @@ class PlateViewer(wx.Frame, CPATool):
                                 GetWhereClauseForWells(wellkeys)))
             annotations = list(set([a[0] for a in annotations]))
             if len(annotations) == 1:
-                if annotations[0] == None:
+                if annotations[0] is None:
                     self.annotationLabel.SetValue('')
                 else:
                     self.annotationLabel.SetValue(str(annotations[0]))
@@ -720,7 +731,7 @@ def FormatPlateMapData(keys_and_vals, categorical=False):
                   ])
     if nsites > 1:
         # add a sites dimension to the array shape if there's >1 site per well
-        shape += [nsites]
+        shape.append(nsites)
     data = np.ones(shape) * np.nan
     if categorical:
         data = data.astype('object')
@@ -773,7 +784,7 @@ def get_non_blob_types_from_table(table):
     return [m for m,t in zip(measurements, types) if not 'blob' in t.lower()]
 
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
 
     logging.basicConfig(level=logging.DEBUG)
 
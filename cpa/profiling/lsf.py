@@ -133,7 +133,7 @@ class LSFView(object):
                 return
             time.sleep(1)
 
-def test_function((seconds)):
+def test_function(seconds):
     import time
     time.sleep(seconds)
     return seconds
@@ -100,7 +100,7 @@ class Uniprocessing(ParallelProcessor):
 class UniprocessingView(object):
     imap = itertools.imap
 
-def test_function((seconds)):
+def test_function(seconds):
     import time
     time.sleep(seconds)
     return seconds
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 
-def _compute_mixture_probabilities((cache_dir, normalization_name, 
-                                    preprocess_file, images, gmm, meanvector, 
-                                    loadings)):
+def _compute_mixture_probabilities(args):
+    (cache_dir, normalization_name, preprocess_file, images, gmm, meanvector,
+     loadings) = args
     import numpy as np        
     from cpa.profiling import cache
     cache = Cache(cache_dir)
@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
-def _compute_ksstatistic((cache_dir, images, control_images, normalization_name,
-                          preprocess_file)):
+def _compute_ksstatistic(args):
+    (cache_dir, images, control_images, normalization_name,
+     preprocess_file) = args
     import numpy as np 
     import sys
     import cpa
@@ -12,7 +12,8 @@ from .profiles import Profiles
 from .parallel import ParallelProcessor, Uniprocessing
 import string
 
-def _transform_cell_feats((cache_dir, images, normalization_name, output_filename, key, header)):
+def _transform_cell_feats(args):
+    (cache_dir, images, normalization_name, output_filename, key, header) = args
     try:
         import numpy as np
         from .cache import Cache
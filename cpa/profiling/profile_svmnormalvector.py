@@ -74,8 +74,9 @@ class memoized(object):
         """Support instance methods."""
         return functools.partial(self.__call__, obj)
 
-def _compute_svmnormalvector((cache_dir, images, control_images, 
-                              normalization_name, preprocess_file, rfe)):
+def _compute_svmnormalvector(args):
+        (cache_dir, images, control_images,
+         normalization_name, preprocess_file, rfe) = args
     #try:
         import numpy as np 
         import sys
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 
 from __future__ import print_function
-def _compute_group_subsample((cache_dir, normalization_name, image_key, 
-                              indices)):
+def _compute_group_subsample(args):
+    (cache_dir, normalization_name, image_key,
+     indices) = args
     import numpy as np
     from .cache import Cache, normalizations
     cache = Cache(cache_dir)
@@ -39,7 +39,8 @@ SELECTED_OUTLINE_COLOR = colorConverter.to_rgba('black')
 UNSELECTED_OUTLINE_COLOR = colorConverter.to_rgba('black', alpha=0.)
 
 class Datum:
-    def __init__(self, (x, y), color):
+    def __init__(self, pos, color):
+        x, y = pos
         self.x = x
         self.y = y
         self.color = color
@@ -672,7 +673,8 @@ class ScatterPanel(FigureCanvasWxAgg):
         self.redraw()
         self.figure.canvas.draw_idle()
     
-    def show_popup_menu(self, (x,y), data):
+    def show_popup_menu(self, pos, data):
+        x, y = pos
         self.popup_menu_filters = {}
         popup = wx.Menu()
 
@@ -682,7 +684,7 @@ class ScatterPanel(FigureCanvasWxAgg):
         if selected_gate:
             selected_gates = [selected_gate]
         self.Bind(wx.EVT_MENU, 
-                  lambda(e):ui.prompt_user_to_create_loadimages_table(self, selected_gates), 
+                  lambda e:ui.prompt_user_to_create_loadimages_table(self, selected_gates), 
                   loadimages_table_item)
         
         show_images_in_gate_item = popup.Append(-1, 'Show images in gate')
@@ -1100,7 +1102,7 @@ class CustomNavToolbar(NavigationToolbar2WxAgg):
     
     
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(level=logging.DEBUG,)
         
     # Load a properties file if passed in args
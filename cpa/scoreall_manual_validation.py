@@ -201,7 +201,7 @@ if __name__ == "__main__":
     ts_file    = sys.argv[2]
     gt_file    = sys.argv[3] # Ground Truth    
     
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     
     ## Set to 50, only for testing! 
     #nRules = int(raw_input('# of rules: '))
@@ -350,7 +350,7 @@ class SortBin(wx.ScrolledWindow):
 
 
 if __name__ == '__main__':
-    app = wx.PySimpleApp()
+    app = wx.App(False)
  
     p.show_load_dialog()    
     import datamodel
@@ -481,7 +481,7 @@ def parse_old_group_query(group_query):
 
 if __name__ == "__main__":
     import wx
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     p.LoadFile('/Users/afraser/cpa_example/example.properties')
 
     app.MainLoop()
@@ -1071,7 +1071,7 @@ def show_loaddata_table(gate_names, as_columns=True):
 
 
 if __name__ == '__main__':
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     logging.basicConfig(level=logging.DEBUG,)
     if p.show_load_dialog():
         frame = TableViewer(None)
@@ -4,6 +4,19 @@ import unittest
 import cpa.dbconnect
 
 
+def save_properties(testcase, p, fields):
+    '''Restore the given fields of the shared Properties instance once the
+    test finishes, so tests don't depend on the order they run in.'''
+    saved = dict((field, p.__dict__[field]) for field in fields if field in p.__dict__)
+    def restore():
+        for field in fields:
+            if field in saved:
+                p.__dict__[field] = saved[field]
+            else:
+                p.__dict__.pop(field, None)
+    testcase.addCleanup(restore)
+
+
 class ExecuteTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -91,4 +104,47 @@ class UpdateWellsTestCase(unittest.TestCase):
             execute.assert_called_with('UPDATE Per_Image SET User_BarColumn="baz" WHERE Well IN ("A01")')
 
 
+class GetWhereClauseForImagesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.p = cpa.dbconnect.p
+        save_properties(self, self.p, ['table_id', 'image_id'])
+        self.p.image_id = 'ImageNumber'
+
+    def test_no_table_id(self):
+        self.p.table_id = None
+        self.assertEqual(cpa.dbconnect.GetWhereClauseForImages([(4,), (3,)]),
+                         'ImageNumber IN (3,4)')
+
+    def test_table_id(self):
+        self.p.table_id = 'TableNumber'
+        self.assertEqual(cpa.dbconnect.GetWhereClauseForImages([(2, 5), (0, 1), (2, 3), (0, 2)]),
+                         '(TableNumber=0 AND ImageNumber IN (1,2)) OR '
+                         '(TableNumber=2 AND ImageNumber IN (3,5))')
 
+    def test_table_id_empty(self):
+        self.p.table_id = 'TableNumber'
+        self.assertEqual(cpa.dbconnect.GetWhereClauseForImages([]), '')
+
+
+class GroupMapTestCase(unittest.TestCase):
+    def setUp(self):
+        self.db = cpa.dbconnect.DBConnect.getInstance()
+        self.p = cpa.dbconnect.p
+        save_properties(self, self.p, ['table_id', 'image_id', '_groups'])
+        self.p.table_id = None
+        self.p.image_id = 'ImageNumber'
+        self.p._groups = {'Well': 'SELECT ImageNumber, Well FROM Per_Image'}
+        self.res = [(1, 'A01'), (2, 'A02'), (3, 'A01')]
+
+    def test_forward(self):
+        with patch.object(self.db, 'execute', return_value=self.res), \
+             patch.object(self.db, 'GetResultColumnNames', return_value=['ImageNumber', 'Well']):
+            d, col_names = self.db.group_map('Well')
+        self.assertEqual(d, {(1,): ('A01',), (2,): ('A02',), (3,): ('A01',)})
+        self.assertEqual(col_names, ['Per_Image.Well'])
+
+    def test_reverse(self):
+        with patch.object(self.db, 'execute', return_value=self.res), \
+             patch.object(self.db, 'GetResultColumnNames', return_value=['ImageNumber', 'Well']):
+            d, col_names = self.db.group_map('Well', reverse=True)
+        self.assertEqual(d, {('A01',): [(1,), (3,)], ('A02',): [(2,)]})
@@ -20,7 +20,7 @@ from classifier import *
 
 import time
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
 
     p = Properties.getInstance()
     db = dbconnect.DBConnect.getInstance()
@@ -21,7 +21,7 @@ if __name__ == "__main__":
     from datatable import DataGrid
     import wx
 
-    app = wx.PySimpleApp()
+    app = wx.App(False)
     
     os.chdir('/Users/afraser/')
     
@@ -166,7 +166,7 @@ class TileLoader(threading.Thread):
 
 ################# FOR TESTING ##########################
 if __name__ == "__main__":
-    app = wx.PySimpleApp()
+    app = wx.App(False)
 
 
     from datamodel import DataModel